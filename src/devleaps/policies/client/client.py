@@ -1,16 +1,42 @@
 #!/usr/bin/env python3
 import json
+import os
 import sys
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
-import requests
+import orjson
 
 from devleaps.policies.client.config import ConfigManager
 
 CLAUDE_SETTINGS_PATH = Path.home() / ".claude" / "settings.json"
 CURSOR_HOOKS_PATH = Path.home() / ".cursor" / "hooks.json"
 
+TIMEOUT_SECONDS = 30
+
+_SESSION = None
+
+
+def _get_session():
+    """Get the shared HTTP session, creating it on first use.
+
+    Reusing one session across hook forwards keeps the TCP/TLS connection
+    to the policy server alive. Importing requests lazily here keeps it off
+    the startup path for install/uninstall/help, which never hit the network.
+    """
+    global _SESSION
+    if _SESSION is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        _SESSION = requests.Session()
+        _SESSION.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+        _SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+        _SESSION.headers["Connection"] = "keep-alive"
+        _SESSION.headers["Content-Type"] = "application/json"
+    return _SESSION
+
+
 HOOK_CONFIG = {
     "matcher": "*",
     "type": "command",
@@ -39,8 +65,10 @@ CURSOR_HOOK_EVENTS = [
 ]
 
 
-def forward_hook(editor: str, bundles: List[str], payload: Dict[str, Any]) -> int:
-    config = ConfigManager.load_config()
+def forward_hook(editor: str, bundles: List[str], payload: Dict[str, Any],
+                 config: Optional[Dict[str, Any]] = None) -> int:
+    if config is None:
+        config = ConfigManager.load_config()
     server_url = ConfigManager.get_server_url(config)
     default_behavior = ConfigManager.get_default_policy_behavior(config)
     hook_event_name = payload.get("hook_event_name")
@@ -57,10 +85,77 @@ def forward_hook(editor: str, bundles: List[str], payload: Dict[str, Any]) -> in
 
     endpoint = f"/policy/{editor}/{hook_event_name}"
 
+    # Serialize once up front; the same bytes are reused if the adapter
+    # retries the request.
+    body = orjson.dumps(wrapped_payload)
+
+    import requests
+
+    try:
+        response = _get_session().post(
+            f"{server_url}{endpoint}",
+            data=body,
+            timeout=TIMEOUT_SECONDS
+        )
+
+        if response.status_code != 200:
+            print(f"Policy server error: HTTP {response.status_code}", file=sys.stderr)
+            print(f"Endpoint: {endpoint}", file=sys.stderr)
+            return 2
+
+        result = orjson.loads(response.content)
+        # Single syscall straight to fd 1, skipping the TextIOWrapper
+        # encode and line-buffer flush.
+        os.write(1, orjson.dumps(result) + b"\n")
+        return 0
+
+    except requests.exceptions.ConnectionError:
+        print(f"Error: Cannot connect to policy server at {server_url}", file=sys.stderr)
+        print("", file=sys.stderr)
+        print("To start the server, run: devleaps-policy-server", file=sys.stderr)
+        print(f"Or configure server_url in ~/.agent-policies/config.json", file=sys.stderr)
+        return 2
+    except Exception as e:
+        print(f"Error: Unexpected failure communicating with policy server", file=sys.stderr)
+        print(f"Details: {e}", file=sys.stderr)
+        print(f"Server: {server_url}", file=sys.stderr)
+        return 2
+
+
+def forward_hook_batch(editor: str, bundles: List[str], payloads: List[Dict[str, Any]],
+                       config: Optional[Dict[str, Any]] = None) -> int:
+    """Forward several hook events to the policy server in one POST.
+
+    Used when stdin supplies newline-delimited JSON; the server's batch
+    endpoint returns one result per event, written back one per line.
+    """
+    if config is None:
+        config = ConfigManager.load_config()
+    server_url = ConfigManager.get_server_url(config)
+    default_behavior = ConfigManager.get_default_policy_behavior(config)
+
+    for payload in payloads:
+        if not payload.get("hook_event_name"):
+            print("Missing hook_event_name in payload", file=sys.stderr)
+            return 2
+
+    wrapped_payload = {
+        "bundles": bundles,
+        "default_policy_behavior": default_behavior,
+        "events": payloads
+    }
+
+    endpoint = f"/policy/{editor}/batch"
+
+    body = orjson.dumps(wrapped_payload)
+
+    import requests
+
     try:
-        response = requests.post(
+        response = _get_session().post(
             f"{server_url}{endpoint}",
-            json=wrapped_payload
+            data=body,
+            timeout=TIMEOUT_SECONDS
         )
 
         if response.status_code != 200:
@@ -68,8 +163,8 @@ def forward_hook(editor: str, bundles: List[str], payload: Dict[str, Any]) -> in
             print(f"Endpoint: {endpoint}", file=sys.stderr)
             return 2
 
-        result = response.json()
-        print(json.dumps(result))
+        results = orjson.loads(response.content)
+        os.write(1, b"\n".join(orjson.dumps(result) for result in results) + b"\n")
         return 0
 
     except requests.exceptions.ConnectionError:
@@ -85,6 +180,33 @@ def forward_hook(editor: str, bundles: List[str], payload: Dict[str, Any]) -> in
         return 2
 
 
+def _save_settings(path: Path, data: Dict[str, Any]) -> None:
+    """Write a settings file atomically, skipping the write when unchanged.
+
+    Serializes once, compares against the bytes already on disk, and only
+    then writes - to a temp file swapped in with os.replace so a crash
+    mid-write never leaves a truncated settings file behind.
+    """
+    serialized = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+
+    try:
+        if path.read_bytes() == serialized:
+            return
+    except OSError:
+        pass
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    tmp_path.write_bytes(serialized)
+    try:
+        # Carry the existing file's mode over so the swap doesn't reset
+        # user-tightened permissions to the process umask.
+        os.chmod(tmp_path, os.stat(path).st_mode)
+    except OSError:
+        pass
+    os.replace(tmp_path, path)
+
+
 def install_claude_hooks() -> int:
     """Configure Claude Code hooks."""
     print("Configuring Claude Code hooks...\n")
@@ -94,8 +216,7 @@ def install_claude_hooks() -> int:
     settings = {}
     if CLAUDE_SETTINGS_PATH.exists():
         try:
-            with open(CLAUDE_SETTINGS_PATH, 'r') as f:
-                settings = json.load(f)
+            settings = orjson.loads(CLAUDE_SETTINGS_PATH.read_bytes())
         except json.JSONDecodeError:
             print(f"Warning: Could not parse {CLAUDE_SETTINGS_PATH}", file=sys.stderr)
             settings = {}
@@ -130,9 +251,7 @@ def install_claude_hooks() -> int:
 
     # Save settings
     if changes_made:
-        CLAUDE_SETTINGS_PATH.parent.mkdir(parents=True, exist_ok=True)
-        with open(CLAUDE_SETTINGS_PATH, 'w') as f:
-            json.dump(settings, f, indent=2)
+        _save_settings(CLAUDE_SETTINGS_PATH, settings)
         print(f"\n✓ Configuration saved to {CLAUDE_SETTINGS_PATH}")
     else:
         print("✓ All hooks already configured - no changes needed")
@@ -149,8 +268,7 @@ def install_cursor_hooks() -> int:
     hooks_config = {"version": 1, "hooks": {}}
     if CURSOR_HOOKS_PATH.exists():
         try:
-            with open(CURSOR_HOOKS_PATH, 'r') as f:
-                hooks_config = json.load(f)
+            hooks_config = orjson.loads(CURSOR_HOOKS_PATH.read_bytes())
         except json.JSONDecodeError:
             print(f"Warning: Could not parse {CURSOR_HOOKS_PATH}", file=sys.stderr)
             hooks_config = {"version": 1, "hooks": {}}
@@ -183,9 +301,7 @@ def install_cursor_hooks() -> int:
 
     # Save hooks
     if changes_made:
-        CURSOR_HOOKS_PATH.parent.mkdir(parents=True, exist_ok=True)
-        with open(CURSOR_HOOKS_PATH, 'w') as f:
-            json.dump(hooks_config, f, indent=2)
+        _save_settings(CURSOR_HOOKS_PATH, hooks_config)
         print(f"\n✓ Configuration saved to {CURSOR_HOOKS_PATH}")
     else:
         print("✓ All hooks already configured - no changes needed")
@@ -202,8 +318,7 @@ def uninstall_claude_hooks() -> int:
         return 0
 
     try:
-        with open(CLAUDE_SETTINGS_PATH, 'r') as f:
-            settings = json.load(f)
+        settings = orjson.loads(CLAUDE_SETTINGS_PATH.read_bytes())
     except json.JSONDecodeError:
         print(f"Warning: Could not parse {CLAUDE_SETTINGS_PATH}", file=sys.stderr)
         return 1
@@ -237,8 +352,7 @@ def uninstall_claude_hooks() -> int:
             print(f"  ✓ Removed hook for {event}")
 
     if changes_made:
-        with open(CLAUDE_SETTINGS_PATH, 'w') as f:
-            json.dump(settings, f, indent=2)
+        _save_settings(CLAUDE_SETTINGS_PATH, settings)
         print(f"\n✓ Configuration updated at {CLAUDE_SETTINGS_PATH}")
     else:
         print("✓ No devleaps-policy-client hooks found - nothing to remove")
@@ -255,8 +369,7 @@ def uninstall_cursor_hooks() -> int:
         return 0
 
     try:
-        with open(CURSOR_HOOKS_PATH, 'r') as f:
-            hooks_config = json.load(f)
+        hooks_config = orjson.loads(CURSOR_HOOKS_PATH.read_bytes())
     except json.JSONDecodeError:
         print(f"Warning: Could not parse {CURSOR_HOOKS_PATH}", file=sys.stderr)
         return 1
@@ -287,8 +400,7 @@ def uninstall_cursor_hooks() -> int:
             print(f"  ✓ Removed hook for {event}")
 
     if changes_made:
-        with open(CURSOR_HOOKS_PATH, 'w') as f:
-            json.dump(hooks_config, f, indent=2)
+        _save_settings(CURSOR_HOOKS_PATH, hooks_config)
         print(f"\n✓ Configuration updated at {CURSOR_HOOKS_PATH}")
     else:
         print("✓ No devleaps-policy-client hooks found - nothing to remove")
@@ -362,9 +474,24 @@ def main():
     bundles = ConfigManager.get_enabled_bundles(config)
 
     try:
-        hook_json = sys.stdin.read().strip()
-        payload = json.loads(hook_json)
-        exit_code = forward_hook(editor, bundles, payload)
+        # Parse stdin bytes directly; orjson tolerates surrounding whitespace,
+        # so no decode-to-str or strip() pass is needed.
+        data = sys.stdin.buffer.read()
+
+        # Newline-delimited JSON batches several events into one request;
+        # a pretty-printed single event falls back to a whole-buffer parse.
+        try:
+            payloads = [orjson.loads(line) for line in data.splitlines() if line.strip()]
+        except json.JSONDecodeError:
+            payloads = [orjson.loads(data)]
+
+        if not payloads:
+            payloads = [orjson.loads(data)]
+
+        if len(payloads) == 1:
+            exit_code = forward_hook(editor, bundles, payloads[0], config)
+        else:
+            exit_code = forward_hook_batch(editor, bundles, payloads, config)
         sys.exit(exit_code)
     except json.JSONDecodeError as e:
         print(f"Invalid JSON in hook payload: {e}", file=sys.stderr)
@@ -27,9 +27,12 @@ Example config (~/.agent-policies/config.json):
 
 import json
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, Optional
 
+import orjson
+
 
 class ConfigManager:
     """Manages configuration loading and merging from multiple levels."""
@@ -48,12 +51,37 @@ class ConfigManager:
             return {}
 
         try:
-            with open(path, "r") as f:
-                return json.load(f)
+            with open(path, "rb") as f:
+                return orjson.loads(f.read())
         except (json.JSONDecodeError, IOError) as e:
             print(f"Warning: Failed to load config from {path}: {e}")
             return {}
 
+    @staticmethod
+    def _mtime(path: Path) -> Optional[int]:
+        """Get a file's mtime in nanoseconds, or None if it doesn't exist."""
+        try:
+            return path.stat().st_mtime_ns
+        except OSError:
+            return None
+
+    @staticmethod
+    @lru_cache(maxsize=4)
+    def _load_merged_cached(
+        home_path: Path,
+        project_path: Path,
+        home_mtime: Optional[int],
+        project_mtime: Optional[int],
+    ) -> Dict[str, Any]:
+        """Load and merge both config files, cached on paths and mtimes.
+
+        The mtimes are part of the cache key, so editing either file
+        invalidates the cached result on the next load.
+        """
+        home_config = ConfigManager._load_config_file(home_path)
+        project_config = ConfigManager._load_config_file(project_path)
+        return ConfigManager._merge_configs(home_config, project_config)
+
     @staticmethod
     def _merge_configs(home_config: Dict[str, Any], project_config: Dict[str, Any]) -> Dict[str, Any]:
         """Merge home and project configs, with project taking precedence."""
@@ -81,16 +109,18 @@ class ConfigManager:
         if project_root is None:
             project_root = os.getcwd()
 
-        # Load home directory config
         home_config_path = Path.home() / ".agent-policies" / "config.json"
-        home_config = cls._load_config_file(home_config_path)
-
-        # Load project directory config
         project_config_path = Path(project_root) / ".agent-policies" / "config.json"
-        project_config = cls._load_config_file(project_config_path)
 
-        # Merge and return
-        return cls._merge_configs(home_config, project_config)
+        # Cached on mtimes: repeat calls skip the open()+parse entirely
+        # until one of the files changes on disk. Copy so callers that
+        # mutate their config can't corrupt the cached dict.
+        return dict(cls._load_merged_cached(
+            home_config_path,
+            project_config_path,
+            cls._mtime(home_config_path),
+            cls._mtime(project_config_path),
+        ))
 
     @staticmethod
     def get_enabled_bundles(config: Optional[Dict[str, Any]] = None) -> list:
@@ -149,7 +179,7 @@ class ConfigManager:
         home_config_path.parent.mkdir(parents=True, exist_ok=True)
 
         # Write default config
-        with open(home_config_path, 'w') as f:
-            json.dump(cls.DEFAULT_CONFIG, f, indent=2)
+        with open(home_config_path, 'wb') as f:
+            f.write(orjson.dumps(cls.DEFAULT_CONFIG, option=orjson.OPT_INDENT_2))
 
         print(f"✓ Created default configuration at {home_config_path}")
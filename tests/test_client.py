@@ -3,26 +3,27 @@
 import json
 from unittest import mock
 
-from devleaps.policies.client.client import forward_hook
+from devleaps.policies.client.client import forward_hook, forward_hook_batch
 from devleaps.policies.client.config import ConfigManager
 
 
-def test_forward_hook_successful_response(capsys):
+def test_forward_hook_successful_response(capfd):
     """forward_hook returns 0 on success and prints response."""
     payload = {"hook_event_name": "PreToolUse", "tool_name": "bash"}
     expected_response = {"continue_": True}
 
-    with mock.patch("devleaps.policies.client.client.requests.post") as mock_post:
+    with mock.patch("devleaps.policies.client.client._get_session") as mock_get_session:
+        mock_post = mock_get_session.return_value.post
         mock_response = mock.Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = expected_response
+        mock_response.content = json.dumps(expected_response).encode()
         mock_post.return_value = mock_response
 
         result = forward_hook("claude-code", ["python-quality"], payload)
 
         assert result == 0
-        captured = capsys.readouterr()
-        assert json.dumps(expected_response) in captured.out
+        captured = capfd.readouterr()
+        assert json.loads(captured.out) == expected_response
 
 
 def test_forward_hook_sends_correct_payload():
@@ -30,16 +31,17 @@ def test_forward_hook_sends_correct_payload():
     payload = {"hook_event_name": "PreToolUse", "tool_name": "bash"}
     bundles = ["python-quality", "git-workflow"]
 
-    with mock.patch("devleaps.policies.client.client.requests.post") as mock_post:
+    with mock.patch("devleaps.policies.client.client._get_session") as mock_get_session:
+        mock_post = mock_get_session.return_value.post
         mock_response = mock.Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {"continue_": True}
+        mock_response.content = b'{"continue_": true}'
         mock_post.return_value = mock_response
 
         forward_hook("claude-code", bundles, payload)
 
         call_args = mock_post.call_args
-        sent_payload = call_args[1]["json"]
+        sent_payload = json.loads(call_args[1]["data"])
         assert sent_payload["bundles"] == bundles
         assert sent_payload["event"] == payload
 
@@ -48,10 +50,11 @@ def test_forward_hook_posts_to_correct_endpoint():
     """forward_hook posts to correct editor and event endpoint."""
     payload = {"hook_event_name": "PreToolUse", "tool_name": "bash"}
 
-    with mock.patch("devleaps.policies.client.client.requests.post") as mock_post:
+    with mock.patch("devleaps.policies.client.client._get_session") as mock_get_session:
+        mock_post = mock_get_session.return_value.post
         mock_response = mock.Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {"continue_": True}
+        mock_response.content = b'{"continue_": true}'
         mock_post.return_value = mock_response
 
         forward_hook("claude-code", [], payload)
@@ -61,20 +64,69 @@ def test_forward_hook_posts_to_correct_endpoint():
         assert "/policy/claude-code/PreToolUse" in url
 
 
-def test_forward_hook_multiple_bundles(capsys):
+def test_forward_hook_multiple_bundles(capfd):
     """forward_hook works with multiple enabled bundles."""
     payload = {"hook_event_name": "PreToolUse", "tool_name": "bash"}
     bundles = ["python-quality", "git-workflow"]
 
-    with mock.patch("devleaps.policies.client.client.requests.post") as mock_post:
+    with mock.patch("devleaps.policies.client.client._get_session") as mock_get_session:
+        mock_post = mock_get_session.return_value.post
         mock_response = mock.Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {"continue_": True, "reason": "allowed"}
+        mock_response.content = b'{"continue_": true, "reason": "allowed"}'
         mock_post.return_value = mock_response
 
         result = forward_hook("claude-code", bundles, payload)
 
         assert result == 0
         call_args = mock_post.call_args
-        sent_payload = call_args[1]["json"]
+        sent_payload = json.loads(call_args[1]["data"])
         assert len(sent_payload["bundles"]) == 2
+
+
+def test_forward_hook_batch_posts_to_batch_endpoint():
+    """forward_hook_batch sends all events in one POST to the batch endpoint."""
+    payloads = [
+        {"hook_event_name": "PreToolUse", "tool_name": "bash"},
+        {"hook_event_name": "PostToolUse", "tool_name": "bash"},
+    ]
+
+    with mock.patch("devleaps.policies.client.client._get_session") as mock_get_session:
+        mock_post = mock_get_session.return_value.post
+        mock_response = mock.Mock()
+        mock_response.status_code = 200
+        mock_response.content = b'[{"continue_": true}, {"continue_": true}]'
+        mock_post.return_value = mock_response
+
+        result = forward_hook_batch("claude-code", ["python-quality"], payloads)
+
+        assert result == 0
+        assert mock_post.call_count == 1
+        call_args = mock_post.call_args
+        assert "/policy/claude-code/batch" in call_args[0][0]
+        sent_payload = json.loads(call_args[1]["data"])
+        assert sent_payload["events"] == payloads
+
+
+def test_forward_hook_batch_writes_one_result_per_line(capfd):
+    """forward_hook_batch writes each server result on its own line."""
+    payloads = [
+        {"hook_event_name": "PreToolUse", "tool_name": "bash"},
+        {"hook_event_name": "PostToolUse", "tool_name": "bash"},
+    ]
+
+    with mock.patch("devleaps.policies.client.client._get_session") as mock_get_session:
+        mock_post = mock_get_session.return_value.post
+        mock_response = mock.Mock()
+        mock_response.status_code = 200
+        mock_response.content = b'[{"continue_": true}, {"continue_": false}]'
+        mock_post.return_value = mock_response
+
+        result = forward_hook_batch("claude-code", [], payloads)
+
+        assert result == 0
+        captured = capfd.readouterr()
+        lines = [line for line in captured.out.splitlines() if line]
+        assert len(lines) == 2
+        assert json.loads(lines[0]) == {"continue_": True}
+        assert json.loads(lines[1]) == {"continue_": False}
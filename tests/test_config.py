@@ -36,3 +36,25 @@ def test_get_editor():
     config = {"editor": "cursor"}
     result = ConfigManager.get_editor(config)
     assert result == "cursor"
+
+
+def test_load_config_reloads_after_file_change():
+    """load_config picks up changes to config files via mtime invalidation."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        home = Path(tmpdir) / "home"
+        project = Path(tmpdir) / "project"
+        config_dir = home / ".agent-policies"
+        config_dir.mkdir(parents=True)
+        project.mkdir()
+
+        config_path = config_dir / "config.json"
+        config_path.write_text(json.dumps({"editor": "claude-code"}))
+
+        with mock.patch("devleaps.policies.client.config.Path.home", return_value=home):
+            first = ConfigManager.load_config(project_root=str(project))
+            assert first["editor"] == "claude-code"
+
+            config_path.write_text(json.dumps({"editor": "cursor"}))
+            os.utime(config_path, ns=(1, 1))
+            second = ConfigManager.load_config(project_root=str(project))
+            assert second["editor"] == "cursor"